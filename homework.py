@@ -1,26 +1,29 @@
-from dataclasses import dataclass, asdict
-from typing import ClassVar, Dict, Type
+from dataclasses import dataclass
+from typing import ClassVar, Dict, Final, Iterable, Iterator, Tuple, Type
 
 
 @dataclass
 class InfoMessage:
     """Информационное сообщение о тренировке."""
 
+    __slots__ = ('training_type', 'duration', 'distance', 'speed',
+                 'calories')
+
     training_type: str
     duration: float
     distance: float
     speed: float
     calories: float
-    MSG: ClassVar[str] = ('Тип тренировки: {}; '
-                          'Длительность: {:.3f} ч.; '
-                          'Дистанция: {:.3f} км; '
-                          'Ср. скорость: {:.3f} км/ч; '
-                          'Потрачено ккал: {:.3f}.')
+    MSG: ClassVar[str] = ('Тип тренировки: %s; '
+                          'Длительность: %.3f ч.; '
+                          'Дистанция: %.3f км; '
+                          'Ср. скорость: %.3f км/ч; '
+                          'Потрачено ккал: %.3f.')
 
     def get_message(self) -> str:
         """Вывод информации на экран."""
-        items = asdict(self)
-        return self.MSG.format(*items.values())
+        return self.MSG % (self.training_type, self.duration,
+                           self.distance, self.speed, self.calories)
 
 
 class Training:
@@ -35,17 +38,38 @@ class Training:
                  duration: float,
                  weight: float,
                  ) -> None:
-        self.action = action
-        self.duration_h = duration
+        self._action = action
+        self._duration_h = duration
         self.weight = weight
+        self._distance = self._calc_distance(action)
+        self._speed = self._calc_mean_speed()
+
+    @property
+    def action(self) -> int:
+        """Количество совершенных действий."""
+        return self._action
+
+    @property
+    def duration_h(self) -> float:
+        """Длительность тренировки в часах."""
+        return self._duration_h
+
+    @classmethod
+    def _calc_distance(cls, action: int) -> float:
+        """Формула дистанции в км."""
+        return (action * cls.LEN_STEP) / cls.M_IN_KM
+
+    def _calc_mean_speed(self) -> float:
+        """Формула средней скорости движения."""
+        return self._distance / self._duration_h
 
     def get_distance(self) -> float:
         """Получить дистанцию в км."""
-        return (self.action * self.LEN_STEP) / self.M_IN_KM
+        return self._distance
 
     def get_mean_speed(self) -> float:
         """Получить среднюю скорость движения."""
-        return self.get_distance() / self.duration_h
+        return self._speed
 
     def get_spent_calories(self) -> float:
         """Получить количество затраченных калорий."""
@@ -55,9 +79,9 @@ class Training:
 
     def show_training_info(self) -> InfoMessage:
         """Вернуть информационное сообщение о выполненной тренировке."""
-        msg = InfoMessage(type(self).__name__, self.duration_h,
-                          self.get_distance(),
-                          self.get_mean_speed(),
+        msg = InfoMessage(type(self).__name__, self._duration_h,
+                          self._distance,
+                          self._speed,
                           self.get_spent_calories())
         return msg
 
@@ -70,11 +94,10 @@ class Running(Training):
 
     def get_spent_calories(self) -> float:
         """Расчет калорий при беге."""
-        return ((self.CALORIES_MEAN_SPEED_MULTIPLIER_FIRST
-                 * self.get_mean_speed()
+        return ((self.CALORIES_MEAN_SPEED_MULTIPLIER_FIRST * self._speed
                  - self.CALORIES_MEAN_SPEED_MULTIPLIER_SECOND)
                 * self.weight / self.M_IN_KM
-                * (self.duration_h * self.MIN_IN_HOUR))
+                * (self._duration_h * self.MIN_IN_HOUR))
 
 
 class SportsWalking(Training):
@@ -93,10 +116,12 @@ class SportsWalking(Training):
 
     def get_spent_calories(self) -> float:
         """Расчет калорий при ходьбе."""
+        # Целочисленное деление задано спецификацией: дробная часть
+        # отношения квадрата скорости к росту отбрасывается.
         return ((self.CALORIES_MEAN_SPEED_MULTIPLIER_FIRST * self.weight
-                 + (self.get_mean_speed() ** 2 // self.height)
+                 + (self._speed ** 2 // self.height)
                  * self.CALORIES_MEAN_SPEED_MULTIPLIER_SECOND * self.weight)
-                * (self.duration_h * self.MIN_IN_HOUR))
+                * (self._duration_h * self.MIN_IN_HOUR))
 
 
 class Swimming(Training):
@@ -111,35 +136,57 @@ class Swimming(Training):
                  weight: float,
                  length_pool: float,
                  count_pool: int) -> None:
+        self._length_pool_m = length_pool
+        self._count_pool = count_pool
         super().__init__(action,
                          duration, weight)
-        self.length_pool_m = length_pool
-        self.count_pool = count_pool
 
-    def get_mean_speed(self):
-        """Получить среднюю скорость при плавании."""
-        return (self.length_pool_m * self.count_pool / self.M_IN_KM
-                / self.duration_h)
+    @property
+    def length_pool_m(self) -> float:
+        """Длина бассейна в метрах."""
+        return self._length_pool_m
+
+    @property
+    def count_pool(self) -> int:
+        """Количество переплытых бассейнов."""
+        return self._count_pool
+
+    def _calc_mean_speed(self) -> float:
+        """Формула средней скорости при плавании."""
+        return (self._length_pool_m * self._count_pool / self.M_IN_KM
+                / self._duration_h)
 
     def get_spent_calories(self) -> float:
         """Расчет калорий при плавании."""
-        return ((self.get_mean_speed()
-                 + self.CALORIES_MEAN_SPEED_MULTIPLIER_FIRST)
+        return ((self._speed + self.CALORIES_MEAN_SPEED_MULTIPLIER_FIRST)
                 * self.CALORIES_MEAN_SPEED_MULTIPLIER_SECOND * self.weight)
 
 
+_TRAINING_TYPES: Final[Dict[str, Type[Training]]] = {'SWM': Swimming,
+                                                     'RUN': Running,
+                                                     'WLK': SportsWalking}
+
+
 def read_package(workout_type: str, data: list) -> Training:
     """Прочитать данные полученные от датчиков."""
     try:
-        training_type: Dict[str, Type[Training]] = {'SWM': Swimming,
-                                                    'RUN': Running,
-                                                    'WLK': SportsWalking}
-        return training_type.get(workout_type)(*data)
-    except (ValueError, TypeError, AttributeError) as ex:
+        training = _TRAINING_TYPES.get(workout_type)
+        if training is None:
+            raise KeyError(workout_type)
+        return training(*data)
+    except (ValueError, TypeError, KeyError, ZeroDivisionError) as ex:
         print(f'Сегодня останешься без тренировки, прости, '
               f'но делать нечего - у нас ошибка: {ex}')
 
 
+def read_packages(packages: Iterable[Tuple[str, list]]) -> Iterator[str]:
+    """Выдать сообщения по серии пакетов в порядке поступления."""
+    for workout_type, data in packages:
+        training = read_package(workout_type, data)
+        if training is not None:
+            yield training.show_training_info().get_message()
+
+
 def main(training: Training) -> None:
     """Главная функция."""
     info = training.show_training_info()
@@ -154,6 +201,5 @@ if __name__ == '__main__':
         ('GGR', [88, 2, 0]),  # тест-ошибка
     ]
 
-    for workout_type, data in packages:
-        training = read_package(workout_type, data)
-        main(training)
+    for message in read_packages(packages):
+        print(message)
@@ -41,6 +41,19 @@ def test_read_package_return(input_data, expected):
     )
 
 
+def test_read_package_unknown_type():
+    with Capturing() as get_message_output:
+        result = homework.read_package('GGR', [88, 2, 0])
+    assert result is None, (
+        'Функция `read_package` не должна возвращать тренировку '
+        'для неизвестного кода.'
+    )
+    assert len(get_message_output) == 1 and 'GGR' in get_message_output[0], (
+        'Функция `read_package` должна сообщать о неизвестном '
+        'коде тренировки.'
+    )
+
+
 def test_InfoMessage():
     assert inspect.isclass(homework.InfoMessage), (
         'Проверьте, что `InfoMessage` - это класс.'
@@ -363,3 +376,163 @@ def test_main_output(input_data, expected):
     assert get_message_output == expected, (
         'Метод `main` должен печатать результат в консоль.\n'
     )
+
+
+def test_read_packages_output():
+    assert hasattr(homework, 'read_packages'), (
+        'Создайте функцию для обработки серии пакетов - `read_packages`'
+    )
+    packages = [
+        ('SWM', [720, 1, 80, 25, 40]),
+        ('RUN', [1206, 12, 6]),
+        ('WLK', [9000, 1, 75, 180]),
+        ('RUN', [15000, 1, 75]),
+    ]
+    expected = []
+    for workout_type, data in packages:
+        with Capturing() as get_message_output:
+            homework.main(homework.read_package(workout_type, data))
+        expected.extend(get_message_output)
+    result = list(homework.read_packages(packages))
+    assert result == expected, (
+        'Функция `read_packages` должна возвращать те же сообщения, '
+        'что и `main`, в порядке поступления пакетов.'
+    )
+
+
+@pytest.mark.parametrize('packages', [
+    [('RUN', [15000, 1, 75]), ('RUN', [15000, 1])],
+    [('RUN', [15000, 1, 75, 999]), ('RUN', [15000, 1, 75])],
+    [('WLK', [9000, 1, 75]), ('WLK', [9000, 1, 75, 180])],
+    [('SWM', [720, 1, 80, 25, 40]), ('SWM', [720, 1, 80, 25])],
+])
+def test_read_packages_mixed_arity(packages):
+    expected = []
+    errors = 0
+    for workout_type, data in packages:
+        with Capturing() as get_message_output:
+            training = homework.read_package(workout_type, data)
+            if training is not None:
+                homework.main(training)
+        if training is None:
+            errors += 1
+        else:
+            expected.extend(get_message_output)
+    with Capturing() as get_message_output:
+        result = list(homework.read_packages(packages))
+    assert result == expected, (
+        'Функция `read_packages` должна пропускать только пакеты '
+        'с неверным количеством данных.'
+    )
+    assert len(get_message_output) == errors == 1, (
+        'Функция `read_packages` должна сообщать о каждом пакете '
+        'с ошибкой.'
+    )
+
+
+def test_read_packages_unknown_type():
+    with Capturing() as get_message_output:
+        result = list(homework.read_packages([
+            ('GGR', [88, 2, 0]),
+            ('WLK', [9000, 1, 75, 180]),
+        ]))
+    assert len(get_message_output) == 1, (
+        'Функция `read_packages` должна сообщать о неизвестном '
+        'коде тренировки.'
+    )
+    assert result == [
+        'Тип тренировки: SportsWalking; '
+        'Длительность: 1.000 ч.; '
+        'Дистанция: 5.850 км; '
+        'Ср. скорость: 5.850 км/ч; '
+        'Потрачено ккал: 157.500.'
+    ], (
+        'Функция `read_packages` должна пропускать пакеты '
+        'с неизвестным кодом тренировки.'
+    )
+
+
+@pytest.mark.parametrize('parent, input_data', [
+    ('Running', [9000, 1, 75]),
+    ('SportsWalking', [9000, 1, 75, 180]),
+    ('Swimming', [720, 1, 80, 25, 40]),
+])
+def test_subclass_calories_constants(parent, input_data):
+    parent_class = getattr(homework, parent)
+    child_class = type('Child', (parent_class,), {
+        'CALORIES_MEAN_SPEED_MULTIPLIER_FIRST': 100,
+    })
+    parent_calories = parent_class(*input_data).get_spent_calories()
+    child_calories = child_class(*input_data).get_spent_calories()
+    assert child_calories != parent_calories, (
+        'Формула калорий должна брать константы из класса тренировки.'
+    )
+
+
+@pytest.mark.parametrize('parent, input_data, attributes', [
+    ('Running', [15000, 1, 75], {'M_IN_KM': 1609}),
+    ('SportsWalking', [9000, 1, 75, 180], {'M_IN_KM': 1609}),
+    ('Swimming', [720, 1, 80, 25, 40], {'M_IN_KM': 1609}),
+    ('Running', [15000, 1, 75],
+     {'get_spent_calories': lambda self: 1.0}),
+])
+def test_read_packages_subclass(monkeypatch, parent, input_data,
+                                attributes):
+    child_class = type('Child', (getattr(homework, parent),), attributes)
+    monkeypatch.setitem(homework._TRAINING_TYPES, 'CHD', child_class)
+    with Capturing() as expected:
+        homework.main(homework.read_package('CHD', input_data))
+    result = list(homework.read_packages([('CHD', input_data)]))
+    assert result == expected, (
+        'Функция `read_packages` должна возвращать те же сообщения, '
+        'что и `main`, для наследников классов тренировок.'
+    )
+
+
+def test_read_packages_errors_in_order():
+    packages = [
+        ('SWM', [720, 1, 80, 25, 40]),
+        ('GGR', [88, 2, 0]),
+        ('RUN', [15000, 1, 75]),
+    ]
+    with Capturing() as expected:
+        for workout_type, data in packages:
+            training = homework.read_package(workout_type, data)
+            if training is not None:
+                homework.main(training)
+    with Capturing() as get_message_output:
+        for message in homework.read_packages(packages):
+            print(message)
+    assert get_message_output == expected, (
+        'Сообщения об ошибках должны выводиться в порядке '
+        'поступления пакетов.'
+    )
+
+
+@pytest.mark.parametrize('training_class, input_data, attribute', [
+    ('Running', [15000, 1, 75], 'action'),
+    ('Running', [15000, 1, 75], 'duration_h'),
+    ('Swimming', [720, 1, 80, 25, 40], 'length_pool_m'),
+    ('Swimming', [720, 1, 80, 25, 40], 'count_pool'),
+])
+def test_Training_cached_inputs_read_only(training_class, input_data,
+                                          attribute):
+    training = getattr(homework, training_class)(*input_data)
+    with pytest.raises(AttributeError):
+        setattr(training, attribute, 2)
+
+
+@pytest.mark.parametrize('input_data', [
+    ('RUN', [15000, 0, 75]),
+    ('SWM', [720, 0, 80, 25, 40]),
+])
+def test_read_package_zero_duration(input_data):
+    with Capturing() as get_message_output:
+        result = homework.read_package(*input_data)
+        messages = list(homework.read_packages([input_data]))
+    assert result is None and messages == [], (
+        'Тренировка с нулевой длительностью должна пропускаться.'
+    )
+    assert len(get_message_output) == 2, (
+        'О тренировке с нулевой длительностью нужно сообщать.'
+    )